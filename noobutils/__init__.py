@@ -2,6 +2,7 @@ __version__ = "1.12.3"
 
 from .cog import *
 from .converters import *
+from .cooldowns import *
 from .exceptions import *
 from .views import *
 from .utility import *
@@ -1,13 +1,202 @@
+import asyncio
+import discord
+import functools
+import itertools
 import logging
 
 from redbot.core.bot import commands, Config, Red
 from redbot.core.utils import chat_formatting as cf
 
-from typing import List, Literal
+from typing import Any, Coroutine, List, Literal, Optional, Set, Tuple
 
 from . import __version__ as __nu_version__
 
 
+class NoobTaskManager:
+    def __init__(
+        self,
+        log: logging.Logger,
+        *,
+        max_concurrency: int = 10,
+        max_queue: int = 100,
+        overflow: Literal["drop_new", "drop_oldest"] = "drop_new",
+        drop_log_interval: float = 60.0,
+    ):
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1.")
+        if max_queue < 0:
+            raise ValueError("max_queue must not be negative.")
+        if overflow not in ("drop_new", "drop_oldest"):
+            raise ValueError(f'"{overflow}" is not a valid overflow policy.')
+        self.log = log
+        self.max_concurrency = max_concurrency
+        self.max_queue = max_queue
+        self.overflow = overflow
+        self.drop_log_interval = drop_log_interval
+        self.dropped = 0
+        self._unlogged_drops = 0
+        self._last_drop_log = float("-inf")
+        # Admission is counted here rather than through the queue's maxsize so a
+        # burst gets max_concurrency + max_queue slots even before the workers
+        # have had a chance to pick anything up.
+        self._admitted = 0
+        self._space = asyncio.Event()
+        self._queue: asyncio.Queue[Tuple[str, Coroutine[Any, Any, Any]]] = asyncio.Queue()
+        self._workers: Set[asyncio.Task] = set()
+        self._running: Set[asyncio.Task] = set()
+        self._counter = itertools.count(1)
+        self._closed = False
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    @property
+    def running(self) -> int:
+        return len(self._running)
+
+    @property
+    def queued(self) -> int:
+        return self._queue.qsize()
+
+    @property
+    def capacity(self) -> int:
+        return self.max_concurrency + self.max_queue
+
+    def _ensure_workers(self) -> None:
+        while len(self._workers) < self.max_concurrency:
+            worker = asyncio.create_task(
+                self._worker(), name=f"{self.log.name}.worker-{len(self._workers) + 1}"
+            )
+            self._workers.add(worker)
+            worker.add_done_callback(self._workers.discard)
+
+    def _release(self) -> None:
+        self._admitted -= 1
+        self._queue.task_done()
+        self._space.set()
+
+    async def _worker(self) -> None:
+        while True:
+            name, coro = await self._queue.get()
+            task = None
+            try:
+                task = asyncio.create_task(coro, name=name)
+                self._running.add(task)
+                await task
+            except asyncio.CancelledError:
+                # Only the task itself was cancelled, keep this worker alive.
+                if self._closed or asyncio.current_task().cancelling():
+                    raise
+            except Exception:
+                self.log.exception("Background task %r raised an exception.", name)
+            finally:
+                self._running.discard(task)
+                self._release()
+
+    @staticmethod
+    def _check_coro(coro: Any) -> None:
+        if not asyncio.iscoroutine(coro):
+            raise TypeError(f"Expected a coroutine object, got {coro!r} instead.")
+
+    def _log_drops(self, force: bool = False) -> None:
+        if not self._unlogged_drops:
+            return
+        now = asyncio.get_running_loop().time()
+        if not force and now - self._last_drop_log < self.drop_log_interval:
+            return
+        self.log.warning(
+            "%s background task(s) were dropped because the task queue was full "
+            "(%s dropped in total).",
+            self._unlogged_drops,
+            self.dropped,
+        )
+        self._unlogged_drops = 0
+        self._last_drop_log = now
+
+    def _drop(self, coro: Coroutine[Any, Any, Any]) -> None:
+        coro.close()
+        self.dropped += 1
+        self._unlogged_drops += 1
+        self._log_drops()
+
+    def _drain(self) -> None:
+        while not self._queue.empty():
+            _, coro = self._queue.get_nowait()
+            self._release()
+            coro.close()
+
+    def _admit(self, name: str, coro: Coroutine[Any, Any, Any]) -> None:
+        self._admitted += 1
+        self._queue.put_nowait((name, coro))
+
+    def spawn(self, coro: Coroutine[Any, Any, Any], *, name: Optional[str] = None) -> bool:
+        self._check_coro(coro)
+        name = name or f"{self.log.name}.task-{next(self._counter)}"
+        if self._closed:
+            coro.close()
+            return False
+        self._ensure_workers()
+        if self._admitted >= self.capacity:
+            if self.overflow == "drop_new" or self._queue.empty():
+                self._drop(coro)
+                return False
+            _, old_coro = self._queue.get_nowait()
+            self._release()
+            self._drop(old_coro)
+        self._admit(name, coro)
+        return True
+
+    async def submit(
+        self, coro: Coroutine[Any, Any, Any], *, name: Optional[str] = None
+    ) -> bool:
+        self._check_coro(coro)
+        name = name or f"{self.log.name}.task-{next(self._counter)}"
+        if self._closed:
+            coro.close()
+            return False
+        self._ensure_workers()
+        while not self._closed and self._admitted >= self.capacity:
+            self._space.clear()
+            await self._space.wait()
+        if self._closed:
+            coro.close()
+            return False
+        self._admit(name, coro)
+        return True
+
+    async def join(self) -> None:
+        await self._queue.join()
+
+    async def close(self) -> None:
+        self._closed = True
+        self._space.set()
+        self._drain()
+        self._log_drops(force=True)
+        tasks = [*self._workers, *self._running]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+def _close_tasks_on_unload(cls: type) -> None:
+    # Red cogs rarely call super().cog_unload(), so wrap whatever the subclass
+    # defines to make sure the task manager is always shut down.
+    unload = cls.__dict__.get("cog_unload")
+    if unload is None or getattr(unload, "__noob_closes_tasks__", False):
+        return
+
+    @functools.wraps(unload)
+    async def cog_unload(self) -> None:
+        try:
+            await discord.utils.maybe_coroutine(unload, self)
+        finally:
+            await self.tasks.close()
+
+    cog_unload.__noob_closes_tasks__ = True
+    cls.cog_unload = cog_unload
+
+
 class Cog(commands.Cog):
     def __init__(
         self,
@@ -18,6 +207,9 @@ class Cog(commands.Cog):
         use_config: bool = False,
         identifier: int = 1234567890,
         force_registration: bool = False,
+        max_concurrent_tasks: int = 10,
+        max_queued_tasks: int = 100,
+        task_overflow: Literal["drop_new", "drop_oldest"] = "drop_new",
         *args,
         **kwargs,
     ):
@@ -37,6 +229,26 @@ class Cog(commands.Cog):
         self.__author__ = authors
         self.__docs__ = f"https://github.com/NoobInDaHause/NoobCogs/blob/red-3.5/{cog_name.lower()}/README.md"
         self.log = logging.getLogger(f"red.NoobCogs.{cog_name}")
+        self.tasks = NoobTaskManager(
+            self.log,
+            max_concurrency=max_concurrent_tasks,
+            max_queue=max_queued_tasks,
+            overflow=task_overflow,
+        )
+
+    def spawn_task(
+        self, coro: Coroutine[Any, Any, Any], *, name: Optional[str] = None
+    ) -> bool:
+        return self.tasks.spawn(coro, name=name)
+
+    async def submit_task(
+        self, coro: Coroutine[Any, Any, Any], *, name: Optional[str] = None
+    ) -> bool:
+        return await self.tasks.submit(coro, name=name)
+
+    async def cog_unload(self) -> None:
+        await self.tasks.close()
+        await discord.utils.maybe_coroutine(super().cog_unload)
 
     async def red_delete_data_for_user(
         self,
@@ -46,6 +258,10 @@ class Cog(commands.Cog):
     ):
         return await super().red_delete_data_for_user(requester=requester, user_id=user_id)
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        _close_tasks_on_unload(cls)
+
     def format_help_for_context(self, context: commands.Context) -> str:
         plural = "s" if len(self.__author__) > 1 else ""
         return (
@@ -67,6 +283,9 @@ class GroupCog(commands.GroupCog):
         use_config: bool = False,
         identifier: int = 1234567890,
         force_registration: bool = False,
+        max_concurrent_tasks: int = 10,
+        max_queued_tasks: int = 100,
+        task_overflow: Literal["drop_new", "drop_oldest"] = "drop_new",
         *args,
         **kwargs,
     ):
@@ -86,6 +305,26 @@ class GroupCog(commands.GroupCog):
         self.__author__ = authors
         self.__docs__ = f"https://github.com/NoobInDaHause/NoobCogs/blob/red-3.5/{cog_name.lower()}/README.md"
         self.log = logging.getLogger(f"red.NoobCogs.{cog_name}")
+        self.tasks = NoobTaskManager(
+            self.log,
+            max_concurrency=max_concurrent_tasks,
+            max_queue=max_queued_tasks,
+            overflow=task_overflow,
+        )
+
+    def spawn_task(
+        self, coro: Coroutine[Any, Any, Any], *, name: Optional[str] = None
+    ) -> bool:
+        return self.tasks.spawn(coro, name=name)
+
+    async def submit_task(
+        self, coro: Coroutine[Any, Any, Any], *, name: Optional[str] = None
+    ) -> bool:
+        return await self.tasks.submit(coro, name=name)
+
+    async def cog_unload(self) -> None:
+        await self.tasks.close()
+        await discord.utils.maybe_coroutine(super().cog_unload)
 
     async def red_delete_data_for_user(
         self,
@@ -95,6 +334,10 @@ class GroupCog(commands.GroupCog):
     ):
         return await super().red_delete_data_for_user(requester=requester, user_id=user_id)
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        _close_tasks_on_unload(cls)
+
     def format_help_for_context(self, context: commands.Context) -> str:
         plural = "s" if len(self.__author__) > 1 else ""
         return (
@@ -0,0 +1,232 @@
+from __future__ import annotations
+
+import discord
+import functools
+import math
+import time
+
+from redbot.core.bot import app_commands, commands
+from redbot.core.utils import chat_formatting as cf
+
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Hashable, List, Literal, Optional
+
+
+class NoobRateLimiter:
+    def __init__(
+        self,
+        rate: int,
+        per: float,
+        *,
+        bucket: Literal["user", "member", "channel", "guild", "global"] = "user",
+        mode: Literal["token_bucket", "sliding_window"] = "token_bucket",
+        max_keys: int = 10000,
+        on_limited: Optional[Callable[[Any, float], Awaitable[Any]]] = None,
+    ):
+        if rate < 1 or per <= 0:
+            raise ValueError("rate must be at least 1 and per must be greater than 0.")
+        if bucket not in ("user", "member", "channel", "guild", "global"):
+            raise ValueError(f'"{bucket}" is not a valid bucket type.')
+        if mode not in ("token_bucket", "sliding_window"):
+            raise ValueError(f'"{mode}" is not a valid rate limit mode.')
+        if max_keys < 1:
+            raise ValueError("max_keys must be at least 1.")
+        self.rate = rate
+        self.per = per
+        self.bucket = bucket
+        self.mode = mode
+        self.max_keys = max_keys
+        self.on_limited = on_limited
+        self._cache: OrderedDict[Hashable, List[float]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    def get_key(self, obj: Any) -> Optional[Hashable]:
+        if self.bucket == "global":
+            return 0
+        if isinstance(obj, (commands.Context, discord.Message)):
+            user, channel, guild = obj.author, obj.channel, obj.guild
+        elif isinstance(obj, discord.Interaction):
+            user, channel, guild = obj.user, obj.channel, obj.guild
+        else:
+            return None
+        if self.bucket == "user":
+            return user.id if user else None
+        if self.bucket == "member":
+            return (guild.id if guild else None, user.id) if user else None
+        if self.bucket == "channel":
+            return channel.id if channel else None
+        return guild.id if guild else (channel.id if channel else None)
+
+    def _is_idle(self, state: List[float], now: float) -> bool:
+        # A bucket that has fully refilled (or whose windows have both passed)
+        # holds no information and can be forgotten.
+        return now - state[-1] >= self.per * (2 if self.mode == "sliding_window" else 1)
+
+    def _expire(self, now: float) -> None:
+        for _ in range(2):
+            if not self._cache:
+                return
+            key, state = next(iter(self._cache.items()))
+            if not self._is_idle(state, now):
+                return
+            del self._cache[key]
+
+    def _get_state(self, key: Hashable, now: float) -> List[float]:
+        state = self._cache.get(key)
+        if state is None or self._is_idle(state, now):
+            # token bucket: [tokens, updated]
+            # sliding window: [window start, current count, previous count, updated]
+            state = (
+                [float(self.rate), now]
+                if self.mode == "token_bucket"
+                else [now, 0.0, 0.0, now]
+            )
+            self._cache[key] = state
+            while len(self._cache) > self.max_keys:
+                self._cache.popitem(last=False)
+        self._cache.move_to_end(key)
+        return state
+
+    def _token_bucket(self, state: List[float], now: float, consume: bool) -> float:
+        tokens = min(self.rate, state[0] + (now - state[1]) * self.rate / self.per)
+        if tokens < 1:
+            state[0], state[1] = tokens, now
+            return (1 - tokens) * self.per / self.rate
+        if consume:
+            tokens -= 1
+        state[0], state[1] = tokens, now
+        return 0.0
+
+    def _sliding_window(self, state: List[float], now: float, consume: bool) -> float:
+        elapsed = now - state[0]
+        if elapsed >= self.per:
+            windows = int(elapsed // self.per)
+            state[2] = state[1] if windows == 1 else 0.0
+            state[1] = 0.0
+            state[0] += windows * self.per
+            elapsed = now - state[0]
+        weight = 1 - elapsed / self.per
+        if state[2] * weight + state[1] + 1 > self.rate:
+            return self._sliding_retry_after(state[1], state[2], elapsed)
+        if consume:
+            state[1] += 1
+            state[3] = now
+        return 0.0
+
+    def _sliding_retry_after(self, current: float, previous: float, elapsed: float) -> float:
+        # Find when previous * weight + current + 1 <= rate again, which may only
+        # happen after the current window has rolled over to become the previous.
+        allowed = self.rate - 1
+        if previous and current <= allowed:
+            return max(0.0, self.per * (1 - (allowed - current) / previous) - elapsed)
+        if not current:
+            return self.per - elapsed
+        return self.per * (2 - allowed / current) - elapsed
+
+    def _check(self, obj: Any, consume: bool) -> Optional[float]:
+        key = self.get_key(obj)
+        if key is None:
+            return None
+        now = time.monotonic()
+        self._expire(now)
+        state = self._get_state(key, now)
+        if self.mode == "token_bucket":
+            retry_after = self._token_bucket(state, now, consume)
+        else:
+            retry_after = self._sliding_window(state, now, consume)
+        return retry_after or None
+
+    def get_retry_after(self, obj: Any) -> Optional[float]:
+        return self._check(obj, consume=False)
+
+    def update_rate_limit(self, obj: Any) -> Optional[float]:
+        return self._check(obj, consume=True)
+
+    def reset(self, obj: Any = None) -> None:
+        if obj is None:
+            self._cache.clear()
+        else:
+            self._cache.pop(self.get_key(obj), None)
+
+    @staticmethod
+    def find_source(args: tuple) -> Any:
+        for arg in args:
+            if isinstance(arg, (commands.Context, discord.Interaction, discord.Message)):
+                return arg
+        return None
+
+    async def handle_limited(self, obj: Any, retry_after: float) -> None:
+        if self.on_limited is not None:
+            await self.on_limited(obj, retry_after)
+            return
+        content = (
+            "You are on cooldown. Try again in "
+            f"{cf.humanize_timedelta(seconds=math.ceil(retry_after))}."
+        )
+        if isinstance(obj, commands.Context):
+            await obj.send(content=content, delete_after=min(retry_after, 10) + 1)
+        elif isinstance(obj, discord.Interaction):
+            if obj.response.is_done():
+                await obj.followup.send(content=content, ephemeral=True)
+            else:
+                await obj.response.send_message(content=content, ephemeral=True)
+
+    def as_check(self) -> Callable[[Any], Any]:
+        bucket_type = {
+            "user": commands.BucketType.user,
+            "member": commands.BucketType.member,
+            "channel": commands.BucketType.channel,
+            "guild": commands.BucketType.guild,
+            "global": commands.BucketType.default,
+        }[self.bucket]
+
+        def predicate(ctx: commands.Context) -> bool:
+            retry_after = self.update_rate_limit(ctx)
+            if retry_after:
+                raise commands.CommandOnCooldown(
+                    commands.Cooldown(self.rate, self.per), retry_after, bucket_type
+                )
+            return True
+
+        return commands.check(predicate)
+
+    def as_app_check(self) -> Callable[[Any], Any]:
+        def predicate(interaction: discord.Interaction) -> bool:
+            retry_after = self.update_rate_limit(interaction)
+            if retry_after:
+                raise app_commands.CommandOnCooldown(
+                    app_commands.Cooldown(self.rate, self.per), retry_after
+                )
+            return True
+
+        return app_commands.check(predicate)
+
+    # Wrapping replaces the callback's __globals__, which breaks string annotations
+    # on app and hybrid commands. Use this for prefix commands, listeners and view
+    # callbacks, and as_check()/as_app_check() for hybrid and app commands.
+    def __call__(self, func: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            source = self.find_source(args)
+            retry_after = self.update_rate_limit(source)
+            if retry_after:
+                return await self.handle_limited(source, retry_after)
+            return await func(*args, **kwargs)
+
+        return wrapper
+
+
+def noob_cooldown(
+    rate: int,
+    per: float,
+    *,
+    bucket: Literal["user", "member", "channel", "guild", "global"] = "user",
+    mode: Literal["token_bucket", "sliding_window"] = "token_bucket",
+    max_keys: int = 10000,
+    on_limited: Optional[Callable[[Any, float], Awaitable[Any]]] = None,
+) -> Callable[[Callable[..., Awaitable[Any]]], Callable[..., Awaitable[Any]]]:
+    return NoobRateLimiter(
+        rate, per, bucket=bucket, mode=mode, max_keys=max_keys, on_limited=on_limited
+    )
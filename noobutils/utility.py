@@ -1,11 +1,13 @@
 import discord
+import hashlib
 
 from redbot.core.errors import CogLoadError
 from redbot.core.utils import chat_formatting as cf
 
+from collections import OrderedDict
 from datetime import datetime
 from packaging import version
-from typing import Union, List, Literal
+from typing import Optional, Tuple, Union, List, Literal
 
 from . import __version__
 from .converters import NoobCoordinate
@@ -80,6 +82,67 @@ def get_button_colour(
     raise ButtonColourNotFound(f'"{colour}" is not a valid button colour.')
 
 
+class NoobPageCache:
+    def __init__(self, max_size: int = 4_000_000, max_entries: int = 128):
+        self.max_size = max_size
+        self.max_entries = max_entries
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self._cache: OrderedDict[str, Tuple[int, List[Union[discord.Embed, str]]]] = (
+            OrderedDict()
+        )
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    @staticmethod
+    def make_key(text: str, *params) -> str:
+        digest = hashlib.sha256(text.encode("utf-8", "surrogatepass"))
+        digest.update(repr(params).encode("utf-8", "surrogatepass"))
+        return digest.hexdigest()
+
+    @staticmethod
+    def _copy(pages: List[Union[discord.Embed, str]]) -> List[Union[discord.Embed, str]]:
+        return [page.copy() if isinstance(page, discord.Embed) else page for page in pages]
+
+    def get(self, key: str) -> Optional[List[Union[discord.Embed, str]]]:
+        entry = self._cache.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._cache.move_to_end(key)
+        return self._copy(entry[1])
+
+    def put(self, key: str, pages: List[Union[discord.Embed, str]], size: int) -> None:
+        if size > self.max_size:
+            return
+        if key in self._cache:
+            self.size -= self._cache.pop(key)[0]
+        self._cache[key] = (size, self._copy(pages))
+        self.size += size
+        while self.size > self.max_size or len(self._cache) > self.max_entries:
+            self.size -= self._cache.popitem(last=False)[1][0]
+
+    def clear(self) -> None:
+        self._cache.clear()
+        self.size = 0
+
+    def info(self) -> dict:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "entries": len(self._cache),
+            "size": self.size,
+            "max_size": self.max_size,
+            "max_entries": self.max_entries,
+        }
+
+
+pagify_cache = NoobPageCache()
+
+
 def pagify_this(
     big_ass_variable_string: str,
     delims: List[str] = None,
@@ -94,9 +157,29 @@ def pagify_this(
     footer_icon: str = None,
     author_icon: str = None,
     author_name: str = None,
+    use_cache: bool = False,
 ) -> List[Union[discord.Embed, str]]:
     if delims is None:
         delims = ["\n"]
+    if use_cache:
+        key = pagify_cache.make_key(
+            big_ass_variable_string,
+            tuple(delims),
+            page_text,
+            page_char,
+            is_embed,
+            embed_title,
+            embed_colour.value if isinstance(embed_colour, discord.Colour) else embed_colour,
+            embed_thumbnail,
+            embed_image,
+            embed_timestamp.isoformat() if embed_timestamp else None,
+            footer_icon,
+            author_icon,
+            author_name,
+        )
+        cached = pagify_cache.get(key)
+        if cached is not None:
+            return cached
     final_page = []
     page_length = page_char if is_embed else (page_char - 50)
     pages = list(
@@ -125,6 +208,8 @@ def pagify_this(
         else:
             final_page.append(f"{page}\n\n{formatted_page_text}")
 
+    if use_cache:
+        pagify_cache.put(key, final_page, len(big_ass_variable_string))
     return final_page
 
 
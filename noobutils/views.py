@@ -1,19 +1,54 @@
 from __future__ import annotations
 
+import asyncio
 import contextlib
 import discord
+import json
+import mmap
+import re
+import tempfile
+import time
+
+from array import array
+from bisect import bisect_left, bisect_right
 
 from redbot.core.bot import commands, Red
 from redbot.core.utils import chat_formatting as cf
 
-from typing import Dict, Union, List, Any, Union
+from typing import ClassVar, Dict, Iterable, Optional, Set, Union, List, Any, Union
 
 from .utility import get_button_colour, access_denied
 from .exceptions import NoContextOrInteractionFound
 
 
+class NoobLatencyStats:
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.auto_deferred = 0
+
+    @property
+    def average(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def record(self, latency: float, deferred: bool = False) -> None:
+        self.count += 1
+        self.total += latency
+        self.max = max(self.max, latency)
+        if deferred:
+            self.auto_deferred += 1
+
+    def __repr__(self) -> str:
+        return (
+            f"<NoobLatencyStats count={self.count} average={self.average:.3f} "
+            f"max={self.max:.3f} auto_deferred={self.auto_deferred}>"
+        )
+
+
 class NoobView(discord.ui.View):
     children: List[discord.ui.Button[NoobView]]
+    ack_latencies: ClassVar[Dict[str, NoobLatencyStats]] = {}
 
     def __init__(
         self,
@@ -24,6 +59,7 @@ class NoobView(discord.ui.View):
         access_denied_as_video: bool = True,
         is_ephemeral: bool = False,
         timeout: float = 180,
+        auto_defer_after: Optional[float] = None,
     ):
         super().__init__(timeout=timeout)
         ctx = isinstance(obj, commands.Context)
@@ -34,10 +70,96 @@ class NoobView(discord.ui.View):
         self.timeout_message = timeout_message
         self.remove_embed_on_timeout = remove_embed_on_timeout
         self.access_denied_as_video = access_denied_as_video
+        self.auto_defer_after = auto_defer_after
+        self._defer_tasks: Set[asyncio.Task] = set()
+        self._ack_started: Dict[int, float] = {}
 
     async def start(self) -> Any:
         pass
 
+    @classmethod
+    def get_ack_latency(cls) -> NoobLatencyStats:
+        return cls.ack_latencies.setdefault(
+            f"{cls.__module__}.{cls.__qualname__}", NoobLatencyStats()
+        )
+
+    def record_ack(
+        self,
+        interaction: discord.Interaction[Red],
+        deferred: bool = False,
+        started: Optional[float] = None,
+    ) -> None:
+        started = self._ack_started.pop(interaction.id, started)
+        if started is not None:
+            self.get_ack_latency().record(time.monotonic() - started, deferred=deferred)
+
+    async def _auto_defer(self, interaction: discord.Interaction[Red]) -> None:
+        if interaction.response.is_done():
+            # Acknowledged somewhere that did not record it, the threshold
+            # is the best bound we have.
+            return self.record_ack(interaction)
+        started = self._ack_started.get(interaction.id)
+        with contextlib.suppress(discord.InteractionResponded, discord.HTTPException):
+            await interaction.response.defer()
+            self.record_ack(interaction, deferred=True, started=started)
+
+    def _schedule_auto_defer(self, interaction: discord.Interaction[Red]) -> None:
+        task = asyncio.create_task(self._auto_defer(interaction))
+        self._defer_tasks.add(task)
+        task.add_done_callback(self._defer_tasks.discard)
+
+    # View._scheduled_task is private discord.py API (present throughout 2.0-2.4,
+    # the range Red 3.5 ships), without it views simply run without auto-defer.
+    if hasattr(discord.ui.View, "_scheduled_task"):
+
+        async def _scheduled_task(
+            self, item: discord.ui.Item, interaction: discord.Interaction[Red]
+        ):
+            if self.auto_defer_after is None:
+                return await super()._scheduled_task(item, interaction)
+            self._ack_started[interaction.id] = time.monotonic()
+            # Runs from a timer so an in-flight defer is never cancelled halfway
+            # when the callback finishes at the same moment.
+            handle = asyncio.get_running_loop().call_later(
+                self.auto_defer_after, self._schedule_auto_defer, interaction
+            )
+            try:
+                return await super()._scheduled_task(item, interaction)
+            finally:
+                handle.cancel()
+                if interaction.response.is_done():
+                    self.record_ack(interaction)
+                else:
+                    self._ack_started.pop(interaction.id, None)
+
+    async def edit_response(self, interaction: discord.Interaction[Red], **kwargs) -> None:
+        if interaction.response.is_done():
+            return await interaction.edit_original_response(**kwargs)
+        try:
+            await interaction.response.edit_message(**kwargs)
+        except discord.InteractionResponded:
+            return await interaction.edit_original_response(**kwargs)
+        except discord.HTTPException as e:
+            # 40060: the auto-defer reached Discord first.
+            if e.code != 40060:
+                raise
+            return await interaction.edit_original_response(**kwargs)
+        self.record_ack(interaction)
+
+    async def send_response(self, interaction: discord.Interaction[Red], **kwargs) -> None:
+        if interaction.response.is_done():
+            return await interaction.followup.send(**kwargs)
+        try:
+            await interaction.response.send_message(**kwargs)
+        except discord.InteractionResponded:
+            return await interaction.followup.send(**kwargs)
+        except discord.HTTPException as e:
+            # 40060: the auto-defer reached Discord first.
+            if e.code != 40060:
+                raise
+            return await interaction.followup.send(**kwargs)
+        self.record_ack(interaction)
+
     async def interaction_check(self, interaction: discord.Interaction[Red]) -> bool:
         if self.ephemeral and self.interaction:
             return True
@@ -49,8 +171,8 @@ class NoobView(discord.ui.View):
             return True
         if self.interaction and (self.interaction.user.id == interaction.user.id):
             return True
-        await interaction.response.send_message(
-            content=access_denied(not self.access_denied_as_video), ephemeral=True
+        await self.send_response(
+            interaction, content=access_denied(not self.access_denied_as_video), ephemeral=True
         )
         return False
 
@@ -91,6 +213,7 @@ class SelectPageButton(discord.ui.Button["NoobPaginator"]):
     async def callback(self, interaction: discord.Interaction[Red]) -> None:
         modal = PageModal()
         await interaction.response.send_modal(modal)
+        self.view.record_ack(interaction)
         await modal.wait()
         if not modal.page.value:
             return
@@ -111,6 +234,50 @@ class SelectPageButton(discord.ui.Button["NoobPaginator"]):
         await self.view.update_page(interaction)
 
 
+class SearchModal(discord.ui.Modal):
+    def __init__(self, default: str = None, timeout: float = 60.0) -> None:
+        super().__init__(title="Search Pages.", timeout=timeout)
+        self.query.default = default
+
+    query = discord.ui.TextInput(min_length=1, max_length=100, label="Search for.")
+
+    async def on_submit(self, interaction: discord.Interaction[Red]):
+        await interaction.response.defer()
+
+    async def on_error(self, interaction: discord.Interaction, error: Exception):
+        await interaction.response.send_message(
+            content=f"Something went wrong. Please report this to the bot owner.\n{cf.box(str(error))}",
+            ephemeral=True,
+        )
+
+
+class SearchPageButton(discord.ui.Button["NoobPaginator"]):
+    view: NoobPaginator
+
+    def __init__(self):
+        super().__init__(style=get_button_colour("grey"), label="Search", emoji="🔍")
+        self.last_query: str = None
+
+    async def callback(self, interaction: discord.Interaction[Red]) -> None:
+        modal = SearchModal(default=self.last_query)
+        await interaction.response.send_modal(modal)
+        self.view.record_ack(interaction)
+        await modal.wait()
+        if not modal.query.value:
+            return
+        self.last_query = modal.query.value
+        results = self.view.build_search_index().search(modal.query.value, self.view.pages)
+        if not results:
+            return await interaction.followup.send(
+                content=f"No pages found containing {cf.inline(modal.query.value)}.",
+                ephemeral=True,
+            )
+        # Searching again with the same query cycles through the matches.
+        position = bisect_right(results, self.view.current_page)
+        self.view.current_page = results[position % len(results)]
+        await self.view.update_page(interaction)
+
+
 class SelectPageMenu(discord.ui.Select):
     view: NoobPaginator
 
@@ -124,6 +291,170 @@ class SelectPageMenu(discord.ui.Select):
         await self.view.update_page(interaction)
 
 
+class NoobPageStore:
+    STRING = 0
+    EMBED = 1
+
+    def __init__(self, pages: Iterable[Union[str, discord.Embed]]):
+        self._file = tempfile.TemporaryFile(prefix="noobutils-pages-")
+        self._offsets = array("Q", [0])
+        self._kinds = bytearray()
+        self._mmap: mmap.mmap = None
+
+        try:
+            for page in pages:
+                self._write(page)
+        except BaseException:
+            self.close()
+            raise
+
+        if not self._kinds:
+            self.close()
+            raise ValueError("The pages list is empty.")
+
+        self._remap()
+
+    def _remap(self) -> None:
+        self._file.flush()
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        if self._offsets[-1]:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def extend(self, pages: Iterable[Union[str, discord.Embed]]) -> None:
+        if self.closed:
+            raise ValueError("This page store is already closed.")
+        for page in pages:
+            self._write(page)
+        self._remap()
+
+    def _write(self, page: Union[str, discord.Embed]) -> None:
+        if isinstance(page, str):
+            kind, data = self.STRING, page.encode("utf-8")
+        elif isinstance(page, discord.Embed):
+            kind = self.EMBED
+            data = json.dumps(page.to_dict(), separators=(",", ":")).encode("utf-8")
+        else:
+            raise TypeError(f"{page!r} is not of type str or discord.Embed.")
+        self._file.write(data)
+        self._kinds.append(kind)
+        self._offsets.append(self._offsets[-1] + len(data))
+
+    @property
+    def closed(self) -> bool:
+        return self._file.closed
+
+    def __len__(self) -> int:
+        return len(self._kinds)
+
+    def __getitem__(self, key: Union[str, int]) -> Union[str, discord.Embed]:
+        if self.closed:
+            raise ValueError("This page store is already closed.")
+        index = int(key)
+        if index < 0 or index >= len(self):
+            raise KeyError(key)
+        start, end = self._offsets[index], self._offsets[index + 1]
+        data = self._mmap[start:end].decode("utf-8") if end > start else ""
+        if self._kinds[index] == self.EMBED:
+            return discord.Embed.from_dict(json.loads(data))
+        return data
+
+    def close(self) -> None:
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        self._file.close()
+
+    def __enter__(self) -> NoobPageStore:
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def __del__(self):
+        with contextlib.suppress(Exception):
+            self.close()
+
+
+class NoobPageIndex:
+    TOKEN_RE = re.compile(r"\w+")
+
+    def __init__(self):
+        self._postings: Dict[str, array] = {}
+        self._vocabulary: Optional[List[str]] = None
+        self.pages_indexed = 0
+
+    @classmethod
+    def tokenize(cls, text: str) -> Set[str]:
+        return set(cls.TOKEN_RE.findall(text.casefold()))
+
+    @staticmethod
+    def normalize(text: str) -> str:
+        return " ".join(text.casefold().split())
+
+    @staticmethod
+    def get_page_text(page: Union[str, discord.Embed]) -> str:
+        if isinstance(page, str):
+            return page
+        parts = [page.title, page.description, page.footer.text, page.author.name]
+        for field in page.fields:
+            parts.extend((field.name, field.value))
+        return "\n".join(part for part in parts if part)
+
+    def add_page(self, index: int, page: Union[str, discord.Embed]) -> None:
+        if index < self.pages_indexed:
+            raise ValueError(f"Page {index} has already been indexed.")
+        for token in self.tokenize(self.get_page_text(page)):
+            postings = self._postings.get(token)
+            if postings is None:
+                postings = self._postings[token] = array("I")
+                self._vocabulary = None
+            postings.append(index)
+        self.pages_indexed = index + 1
+
+    def _prefix_postings(self, prefix: str) -> Set[int]:
+        if self._vocabulary is None:
+            self._vocabulary = sorted(self._postings)
+        matches = set()
+        position = bisect_left(self._vocabulary, prefix)
+        while position < len(self._vocabulary) and self._vocabulary[position].startswith(
+            prefix
+        ):
+            matches.update(self._postings[self._vocabulary[position]])
+            position += 1
+        return matches
+
+    def search(
+        self,
+        query: str,
+        pages: Optional[Union[Dict[str, Union[str, discord.Embed]], NoobPageStore]] = None,
+    ) -> List[int]:
+        words = self.TOKEN_RE.findall(query.casefold())
+        if not words:
+            return []
+        # The index only narrows down candidates, the last word is matched as a
+        # prefix so partial words still find their pages.
+        postings: List[Iterable[int]] = [
+            self._postings.get(word, array("I")) for word in set(words[:-1])
+        ]
+        postings.append(self._prefix_postings(words[-1]))
+        postings.sort(key=len)
+        matches = set(postings[0])
+        for posting in postings[1:]:
+            if not matches:
+                break
+            matches.intersection_update(posting)
+        if pages is None:
+            return sorted(matches)
+        needle = self.normalize(query)
+        return [
+            index
+            for index in sorted(matches)
+            if needle in self.normalize(self.get_page_text(pages[str(index)]))
+        ]
+
+
 class NoobPaginator(NoobView):
     def __init__(
         self,
@@ -132,9 +463,12 @@ class NoobPaginator(NoobView):
         pages: List[Union[str, discord.Embed]],
         use_select_menu: bool = False,
         use_page_button: bool = True,
+        use_search_button: bool = False,
+        use_disk_store: bool = False,
         access_denied_as_video: bool = True,
         is_ephemeral: bool = False,
         timeout: float = 180,
+        auto_defer_after: Optional[float] = None,
     ):
         super().__init__(
             obj=obj,
@@ -143,12 +477,17 @@ class NoobPaginator(NoobView):
             access_denied_as_video=access_denied_as_video,
             is_ephemeral=is_ephemeral,
             timeout=timeout,
+            auto_defer_after=auto_defer_after,
+        )
+        self.pages: Union[Dict[str, Union[str, discord.Embed]], NoobPageStore] = (
+            NoobPageStore(pages) if use_disk_store else self.initialize_pages(pages)
         )
-        self.pages = self.initialize_pages(pages)
         self.current_page = 0
-        self.pages_length = len(pages)
+        self.pages_length = len(self.pages)
         self.use_select_menu = use_select_menu
         self.use_page_button = use_page_button
+        self.use_search_button = use_search_button
+        self.search_index: Optional[NoobPageIndex] = None
 
     @staticmethod
     def initialize_pages(
@@ -178,6 +517,43 @@ class NoobPaginator(NoobView):
 
         return kwargs
 
+    def add_pages(self, pages: List[Union[str, discord.Embed]]) -> None:
+        for page in pages:
+            if not isinstance(page, (str, discord.Embed)):
+                raise TypeError(f"{page!r} is not of type str or discord.Embed.")
+        if isinstance(self.pages, NoobPageStore):
+            self.pages.extend(pages)
+        else:
+            for page in pages:
+                self.pages[str(len(self.pages))] = page
+        self.pages_length = len(self.pages)
+        for item in self.children:
+            if isinstance(item, SelectPageButton):
+                item.max_page = self.pages_length - 1
+        if self.search_index is not None:
+            self.build_search_index()
+
+    def build_search_index(self) -> NoobPageIndex:
+        if self.search_index is None:
+            self.search_index = NoobPageIndex()
+        for index in range(self.search_index.pages_indexed, len(self.pages)):
+            self.search_index.add_page(index, self.pages[str(index)])
+        return self.search_index
+
+    def close_pages(self) -> None:
+        if isinstance(self.pages, NoobPageStore):
+            self.pages.close()
+
+    def stop(self) -> None:
+        super().stop()
+        self.close_pages()
+
+    async def on_timeout(self):
+        try:
+            await super().on_timeout()
+        finally:
+            self.close_pages()
+
     def disable_items(self, index: int):
         maximum = self.pages_length - 1
         if index == 1:
@@ -201,6 +577,9 @@ class NoobPaginator(NoobView):
         if len(self.pages) >= 3:
             if self.use_page_button:
                 self.add_item(SelectPageButton(self.pages_length - 1))
+            if self.use_search_button:
+                self.build_search_index()
+                self.add_item(SearchPageButton())
             if self.use_select_menu:
                 select_options = [
                     discord.SelectOption(label=f"Page {i + 1}", value=i)
@@ -233,10 +612,7 @@ class NoobPaginator(NoobView):
     async def update_page(self, interaction: discord.Interaction[Red]) -> None:
         kwargs = self.get_page_kwargs(self.current_page)
         self.disable_items(len(self.pages))
-        if interaction.response.is_done():
-            await interaction.edit_original_response(**kwargs)
-        else:
-            await interaction.response.edit_message(**kwargs)
+        await self.edit_response(interaction, **kwargs)
 
     @discord.ui.button(emoji="⏪", style=get_button_colour("grey"))
     async def first_page(
@@ -257,6 +633,7 @@ class NoobPaginator(NoobView):
         self, interaction: discord.Interaction[Red], button: discord.ui.Button
     ) -> None:
         await interaction.response.defer()
+        self.record_ack(interaction)
         if self.ephemeral:
             for x in self.children:
                 x.disabled = True
@@ -289,6 +666,7 @@ class NoobConfirmation(NoobView):
         access_denied_as_video: bool = True,
         is_ephemeral: bool = False,
         timeout: float = 180,
+        auto_defer_after: Optional[float] = None,
     ):
         super().__init__(
             obj=obj,
@@ -297,6 +675,7 @@ class NoobConfirmation(NoobView):
             access_denied_as_video=access_denied_as_video,
             is_ephemeral=is_ephemeral,
             timeout=timeout,
+            auto_defer_after=auto_defer_after,
         )
         self.value = None
         self.confirm_action = confirm_action
@@ -328,8 +707,8 @@ class NoobConfirmation(NoobView):
             x.disabled = True
         self.value = True
         self.stop()
-        await interaction.response.edit_message(
-            content=self.confirm_action, embed=None, view=self
+        await self.edit_response(
+            interaction, content=self.confirm_action, embed=None, view=self
         )
 
     @discord.ui.button(label="No", emoji="✖️", style=get_button_colour("red"))
@@ -340,8 +719,8 @@ class NoobConfirmation(NoobView):
             x.disabled = True
         self.value = False
         self.stop()
-        await interaction.response.edit_message(
-            content="Alright not doing that then.", embed=None, view=self
+        await self.edit_response(
+            interaction, content="Alright not doing that then.", embed=None, view=self
         )
 
     async def on_timeout(self):